@@ -4,106 +4,205 @@
 负责从卡片字段中提取音频文件路径
 """
 
-import re
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Set
 from anki.collection import Collection
-from anki.cards import Card
+
+# 可选依赖：hyperscan 提供 SIMD 加速的批量正则扫描，未安装时退回 str.find 扫描
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# 单次 SQL 查询的卡片数量上限（避免超出 SQLite 变量限制）
+SQL_CHUNK_SIZE = 900
+
+# 网络媒体目录模式下并发 stat 的线程数
+EXISTS_CHECK_WORKERS = 16
+
+
+def _build_hyperscan_db():
+    """
+    编译 hyperscan 扫描数据库（hyperscan 未安装或编译失败时返回 None）
+    """
+    if hyperscan is None:
+        return None
+
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[rb'\[sound:[^\]]*\]'],
+            ids=[0],
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+        return db
+    except Exception:
+        return None
+
+
+def _scan_sounds(flds: str) -> Iterator[str]:
+    """
+    扫描字段内容中的 [sound:filename.mp3] 标签（生成器）
+
+    前缀是固定字面量，str.find 的 C 级子串搜索比正则引擎更快
+    逐个产出匹配结果，调用方用 set.update 直接吸收，不再分配中间列表
+
+    Args:
+        flds: 笔记字段内容（可以包含多个字段，\\x1f 分隔）
+
+    Yields:
+        提取到的音频文件名
+    """
+    i = 0
+    while True:
+        j = flds.find('[sound:', i)
+        if j < 0:
+            return
+        k = flds.find(']', j + 7)
+        if k < 0:
+            return
+        yield flds[j + 7:k]
+        i = k + 1
 
 
 class AudioExtractor:
     """音频提取器 - 从卡片中提取音频文件"""
 
-    def __init__(self, col: Collection):
+    def __init__(self, col: Collection, network_media: bool = False):
         """
         初始化音频提取器
 
         Args:
             col: Anki Collection 对象
+            network_media: 媒体文件夹位于慢速网络共享时设为 True，
+                改用并发 stat 做存在性检查（整目录扫描在网络盘上可能更慢）
         """
         self.col = col
-        # 正则表达式匹配 [sound:filename.mp3] 格式
-        self.sound_pattern = re.compile(r'\[sound:(.*?)\]')
+        self.network_media = network_media
+        # 媒体文件夹中的文件名集合（首次使用时扫描，每次提取前刷新）
+        self._media_files = None
+        # hyperscan 扫描数据库（不可用时为 None，退回 str.find 扫描）
+        self._hs_db = _build_hyperscan_db()
 
-    def extract_audio_files(self, card_ids: List[int]) -> List[str]:
+    def _scan_rows(self, rows) -> Set[str]:
         """
-        从卡片列表中提取所有音频文件路径
+        从一批查询结果行中扫描所有 [sound:...] 文件名
+
+        hyperscan 可用时把整批字段拼成一个缓冲区批量扫描，
+        否则逐行退回 str.find 扫描
 
         Args:
-            card_ids: 卡片 ID 列表
+            rows: col.db.all 返回的 (flds,) 行列表
 
         Returns:
-            音频文件的完整路径列表
+            提取到的音频文件名集合
         """
-        audio_files = []
+        found = set()
 
-        for card_id in card_ids:
-            # 获取卡片对象
-            card = self.col.get_card(card_id)
-            if not card:
-                continue
+        if self._hs_db is not None:
+            # 用 ']' 作行分隔符，保证匹配不会跨越两行字段
+            # 完全不含 '[sound:' 的笔记直接跳过，不进扫描缓冲区
+            buf = ']'.join(
+                flds for (flds,) in rows if '[sound:' in flds
+            ).encode('utf-8')
+
+            def on_match(match_id, start, end, flags, context):
+                # 去掉前缀 '[sound:' 和结尾的 ']'
+                found.add(buf[start + 7:end - 1].decode('utf-8', 'replace'))
 
-            # 从卡片中提取音频
-            card_audio_files = self._extract_from_card(card)
-            audio_files.extend(card_audio_files)
+            self._hs_db.scan(buf, match_event_handler=on_match)
+            return found
 
-        # 去重并过滤不存在的文件
-        audio_files = list(set(audio_files))
-        audio_files = [f for f in audio_files if os.path.exists(f)]
+        for (flds,) in rows:
+            # 子串检查是紧凑的 C 级搜索，比扫描后返回空列表便宜得多
+            if '[sound:' not in flds:
+                continue
+            found.update(_scan_sounds(flds))
+        return found
 
-        return audio_files
+    def _refresh_media_files(self) -> None:
+        """
+        扫描一次媒体文件夹，缓存其中所有文件名的集合
+        用集合成员检查代替逐文件 stat，每次提取时刷新以避免缓存过期
+        """
+        self._media_files = frozenset(
+            entry.name for entry in os.scandir(self.col.media.dir())
+        )
 
-    def _extract_from_card(self, card: Card) -> List[str]:
+    def iter_audio_files(self, card_ids: List[int],
+                         chunk_size: int = SQL_CHUNK_SIZE) -> Iterator[str]:
         """
-        从单个卡片中提取音频文件
+        按发现顺序逐个产出音频文件的完整路径（生成器）
+
+        直接读取 notes.flds 原始字段串，不构建 Card/Note 对象
+        （字段解析、模型查找、标签拆分在这里都用不到）
+        每处理完一批卡片就立即产出结果，调用方不必等全部扫描完成
 
         Args:
-            card: Anki 卡片对象
+            card_ids: 卡片 ID 列表
+            chunk_size: 每批 SQL 查询的卡片数量
 
-        Returns:
-            音频文件路径列表
+        Yields:
+            音频文件的完整路径（已去重、已确认存在）
         """
-        audio_files = []
-
-        # 获取笔记对象
-        note = card.note()
-        if not note:
-            return audio_files
-
-        # 遍历笔记的所有字段
-        for field_name, field_value in note.items():
-            # 在字段内容中查找 [sound:...] 标签
-            sound_matches = self.sound_pattern.findall(field_value)
+        # 已检查过的文件名集合，重复的 [sound:...] 引用只处理一次
+        seen = set()
 
-            for sound_file in sound_matches:
-                # 构建完整的文件路径
-                full_path = self._get_full_audio_path(sound_file)
-                if full_path:
-                    audio_files.append(full_path)
+        # 只获取一次媒体文件夹路径
+        media_dir = self.col.media.dir()
 
-        return audio_files
+        # 本地磁盘：扫描一次媒体文件夹做 O(1) 成员检查
+        # 网络共享：整目录扫描可能很慢，改为并发 stat（os.path.exists 释放 GIL）
+        executor = None
+        if self.network_media:
+            executor = ThreadPoolExecutor(max_workers=EXISTS_CHECK_WORKERS)
+        else:
+            self._refresh_media_files()
+
+        try:
+            # 分批用一条 SQL 直接读取笔记字段
+            # 字段以 \x1f 分隔，扫描可以直接在整串上进行
+            for start in range(0, len(card_ids), chunk_size):
+                chunk = card_ids[start:start + chunk_size]
+                ids_sql = "(" + ",".join(str(int(cid)) for cid in chunk) + ")"
+                rows = self.col.db.all(
+                    "SELECT n.flds FROM cards c JOIN notes n ON c.nid = n.id"
+                    " WHERE c.id IN " + ids_sql
+                )
+
+                # 本批新出现的文件名，每个唯一文件名只拼接一次完整路径
+                new_names = [fn for fn in self._scan_rows(rows) if fn not in seen]
+                seen.update(new_names)
+
+                if executor is not None:
+                    paths = [os.path.join(media_dir, fn) for fn in new_names]
+                    for path, exists in zip(paths, executor.map(os.path.exists, paths)):
+                        if exists:
+                            yield path
+                else:
+                    for filename in new_names:
+                        if filename in self._media_files:
+                            yield os.path.join(media_dir, filename)
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
-    def _get_full_audio_path(self, filename: str) -> str:
+    def extract_audio_files(self, card_ids: List[int]) -> List[str]:
         """
-        获取音频文件的完整路径
+        从卡片列表中提取所有音频文件路径
+
+        播放器需要完整列表才能整体乱序，所以保留列表接口；
+        流式消费请直接使用 iter_audio_files
 
         Args:
-            filename: 音频文件名（从 [sound:...] 中提取）
+            card_ids: 卡片 ID 列表
 
         Returns:
-            完整的文件路径，如果文件不存在则返回空字符串
+            音频文件的完整路径列表
         """
-        # 获取 Anki 媒体文件夹路径
-        media_dir = self.col.media.dir()
-
-        # 构建完整路径
-        full_path = os.path.join(media_dir, filename)
-
-        # 检查文件是否存在
-        if os.path.exists(full_path):
-            return full_path
-        else:
-            return ""
+        return list(self.iter_audio_files(card_ids))
 
     def get_audio_count(self, card_ids: List[int]) -> int:
         """
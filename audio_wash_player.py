@@ -59,11 +59,11 @@ def start_audio_wash():
         if include_unlearned and study_mode != StudyMode.NEW_ONLY:
             mode_text += "+预习"
 
+        # 统一生成范围前缀，提示信息只保留一个模板
+        scope = "全部牌组" if not deck_ids else f"牌组「{deck_names}」"
+
         if not card_ids:
-            if not deck_ids:
-                showInfo("今天没有学习或复习任何卡片，无法启动播放器。")
-            else:
-                showInfo(f"牌组「{deck_names}」中今天没有学习或复习任何卡片，无法启动播放器。")
+            showInfo(f"{scope}中今天没有学习或复习任何卡片，无法启动播放器。")
             return
 
         # 获取卡片统计信息
@@ -74,20 +74,12 @@ def start_audio_wash():
         audio_files = audio_extractor.extract_audio_files(card_ids)
 
         if not audio_files:
-            if not deck_ids:
-                showInfo(
-                    f"找到 {card_stats['total']} 张卡片，但没有找到任何音频文件。\n"
-                    f"新学: {card_stats['new']} 张\n"
-                    f"复习: {card_stats['reviewed']} 张\n\n"
-                    f"请确保卡片中包含 [sound:...] 标签。"
-                )
-            else:
-                showInfo(
-                    f"牌组「{deck_names}」中找到 {card_stats['total']} 张卡片，但没有找到任何音频文件。\n"
-                    f"新学: {card_stats['new']} 张\n"
-                    f"复习: {card_stats['reviewed']} 张\n\n"
-                    f"请确保卡片中包含 [sound:...] 标签。"
-                )
+            showInfo(
+                f"{scope}中找到 {card_stats['total']} 张卡片，但没有找到任何音频文件。\n"
+                f"新学: {card_stats['new']} 张\n"
+                f"复习: {card_stats['reviewed']} 张\n\n"
+                f"请确保卡片中包含 [sound:...] 标签。"
+            )
             return
 
         # 3. 创建并显示播放器窗口（使用 None 作为 parent，创建独立窗口）
@@ -4,12 +4,30 @@
 负责查询今天新学的、复习错的、复习对的卡片
 """
 
+import functools
+import heapq
 from datetime import datetime, timedelta
 from typing import List, Optional
 from anki.collection import Collection
 from enum import Enum
 
 
+def _memoize(method):
+    """
+    简单的方法级缓存装饰器
+    把无参查询方法的结果缓存到 self._cache，同一个查询周期内不重复执行搜索
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        if name not in self._cache:
+            self._cache[name] = method(self)
+        return self._cache[name]
+
+    return wrapper
+
+
 class StudyMode(Enum):
     """学习模式枚举"""
     NEW_ONLY = "new_only"  # 仅新学
@@ -37,6 +55,13 @@ class CardQuery:
         self.deck_ids = deck_ids if deck_ids else []
         self.study_mode = study_mode
         self.include_unlearned = include_unlearned
+        # 查询结果缓存（按方法名存储，参数不变时避免重复搜索）
+        self._cache = {}
+        # 牌组过滤条件只构建一次：展开子牌组后直接生成 SQL 片段，
+        # 绕过搜索表达式解析器，利用 cards.did 上的索引
+        self._did_sql = self._build_did_sql()
+        # 今天开始的时间戳只计算一次，多个查询共用
+        self._today_start_ms = self._get_today_start_timestamp()
 
     def get_today_cards(self) -> List[int]:
         """
@@ -47,44 +72,63 @@ class CardQuery:
         """
         card_ids = []
 
-        # 根据学习模式决定查询哪些卡片
+        # 根据学习模式决定查询哪些卡片（各查询结果已被缓存，不会重复执行）
         if self.study_mode == StudyMode.NEW_ONLY:
             # 仅新学模式：只查询今天新学的卡片
-            new_cards = self._get_new_cards_today()
-            card_ids.extend(new_cards)
+            card_ids.extend(self._get_new_cards_today())
 
         elif self.study_mode == StudyMode.REVIEW_ONLY:
             # 仅复习模式：只查询今天复习的卡片
-            reviewed_cards = self._get_reviewed_cards_today()
-            card_ids.extend(reviewed_cards)
+            card_ids.extend(self._get_reviewed_cards_today())
 
             # 如果启用了"包含未学习的新卡片"，添加今天的新卡片
             if self.include_unlearned:
-                unlearned_cards = self._get_unlearned_new_cards()
-                card_ids.extend(unlearned_cards)
+                card_ids.extend(self._get_unlearned_new_cards())
 
         else:  # StudyMode.COMBINED
             # 结合模式：新学 + 复习
-            new_cards = self._get_new_cards_today()
-            card_ids.extend(new_cards)
-
-            reviewed_cards = self._get_reviewed_cards_today()
-            card_ids.extend(reviewed_cards)
+            card_ids.extend(self._get_new_cards_today())
+            card_ids.extend(self._get_reviewed_cards_today())
 
             # 如果启用了"包含未学习的新卡片"，添加未学习的新卡片
             if self.include_unlearned:
-                unlearned_cards = self._get_unlearned_new_cards()
-                card_ids.extend(unlearned_cards)
+                card_ids.extend(self._get_unlearned_new_cards())
 
-        # 去重并限制数量
-        card_ids = list(set(card_ids))
+        # 去重
+        unique_ids = set(card_ids)
 
         # 如果超过最大数量，只取最近的卡片
-        if len(card_ids) > self.max_cards:
-            card_ids = card_ids[-self.max_cards:]
+        # 卡片 ID 是创建时间戳，取最大的 N 个即最新的 N 张（集合顺序不可靠）
+        if len(unique_ids) > self.max_cards:
+            return heapq.nlargest(self.max_cards, unique_ids)
+
+        return list(unique_ids)
+
+    def _build_did_sql(self) -> str:
+        """
+        构建牌组过滤的 SQL 片段
+
+        把选中的牌组展开为包含所有子牌组的 ID 列表
+        牌组 ID 来自 Anki 自身，可以直接内联到 SQL 中
+
+        Returns:
+            形如 '(did IN (1,2,3) OR odid IN (1,2,3))' 的 SQL 片段，
+            未指定牌组时返回空字符串
+        """
+        if not self.deck_ids:
+            return ""
+
+        # 展开每个牌组及其子牌组
+        dids = []
+        for deck_id in self.deck_ids:
+            dids.extend(self.col.decks.deck_and_child_ids(deck_id))
 
-        return card_ids
+        # 同时匹配 odid（原始牌组）：卡片临时转入筛选牌组学习时，
+        # deck: 搜索仍按其所属牌组匹配，这里保持同样的语义
+        ids_sql = ",".join(str(int(did)) for did in dids)
+        return "(did IN (%s) OR odid IN (%s))" % (ids_sql, ids_sql)
 
+    @_memoize
     def _get_new_cards_today(self) -> List[int]:
         """
         获取今天新增的卡片
@@ -92,32 +136,16 @@ class CardQuery:
         Returns:
             新卡片 ID 列表
         """
-        # 获取今天的开始时间戳（毫秒）
-        today_start = self._get_today_start_timestamp()
-
-        # 查询今天添加的卡片
-        # added:1 表示今天添加的卡片
-        query = "added:1"
+        # 卡片 ID 就是创建时间的毫秒时间戳，按今天开始时间过滤即可
+        query = "SELECT id FROM cards WHERE id >= ?"
 
         # 如果指定了牌组，添加牌组过滤
-        if self.deck_ids:
-            # 构建多个牌组的 OR 查询
-            deck_queries = []
-            for deck_id in self.deck_ids:
-                deck_name = self.col.decks.name(deck_id)
-                deck_queries.append(f'deck:"{deck_name}"')
-
-            # 使用括号和 OR 连接多个牌组
-            if len(deck_queries) == 1:
-                query = f'{deck_queries[0]} {query}'
-            else:
-                decks_query = " OR ".join(deck_queries)
-                query = f'({decks_query}) {query}'
+        if self._did_sql:
+            query += " AND " + self._did_sql
 
-        card_ids = self.col.find_cards(query)
-
-        return list(card_ids)
+        return list(self.col.db.list(query, self._today_start_ms))
 
+    @_memoize
     def _get_reviewed_cards_today(self) -> List[int]:
         """
         获取今天复习过的卡片（包括答对和答错的）
@@ -125,29 +153,17 @@ class CardQuery:
         Returns:
             复习过的卡片 ID 列表
         """
-        # 查询今天复习过的卡片
-        # rated:1 表示今天复习过的卡片
-        query = "rated:1"
+        # revlog 的 ID 也是复习时间的毫秒时间戳
+        # ease > 0 排除手动重排等非答题日志条目，与 rated:1 的语义一致
+        query = "SELECT DISTINCT cid FROM revlog WHERE id >= ? AND ease > 0"
 
         # 如果指定了牌组，添加牌组过滤
-        if self.deck_ids:
-            # 构建多个牌组的 OR 查询
-            deck_queries = []
-            for deck_id in self.deck_ids:
-                deck_name = self.col.decks.name(deck_id)
-                deck_queries.append(f'deck:"{deck_name}"')
-
-            # 使用括号和 OR 连接多个牌组
-            if len(deck_queries) == 1:
-                query = f'{deck_queries[0]} {query}'
-            else:
-                decks_query = " OR ".join(deck_queries)
-                query = f'({decks_query}) {query}'
-
-        card_ids = self.col.find_cards(query)
+        if self._did_sql:
+            query += " AND cid IN (SELECT id FROM cards WHERE %s)" % self._did_sql
 
-        return list(card_ids)
+        return list(self.col.db.list(query, self._today_start_ms))
 
+    @_memoize
     def _get_unlearned_new_cards(self) -> List[int]:
         """
         获取未学习的新卡片（is:new 且未被学习过）
@@ -155,30 +171,18 @@ class CardQuery:
         Returns:
             未学习的新卡片 ID 列表
         """
-        # 查询新卡片（尚未学习的卡片）
-        # is:new 表示新卡片，-rated:1 表示今天未复习过
-        query = "is:new"
+        # type = 0 即新卡片类型（对应搜索语法里的 is:new，
+        # 按队列过滤会漏掉被暂停或搁置的新卡片）
+        query = "SELECT id FROM cards WHERE type = 0"
 
         # 如果指定了牌组，添加牌组过滤
-        if self.deck_ids:
-            # 构建多个牌组的 OR 查询
-            deck_queries = []
-            for deck_id in self.deck_ids:
-                deck_name = self.col.decks.name(deck_id)
-                deck_queries.append(f'deck:"{deck_name}"')
-
-            # 使用括号和 OR 连接多个牌组
-            if len(deck_queries) == 1:
-                query = f'{deck_queries[0]} {query}'
-            else:
-                decks_query = " OR ".join(deck_queries)
-                query = f'({decks_query}) {query}'
-
-        card_ids = self.col.find_cards(query)
+        if self._did_sql:
+            query += " AND " + self._did_sql
 
-        return list(card_ids)
+        return list(self.col.db.list(query))
 
-    def _get_today_start_timestamp(self) -> int:
+    @staticmethod
+    def _get_today_start_timestamp() -> int:
         """
         获取今天开始的时间戳（毫秒）
         考虑 Anki 的一天从凌晨 4 点开始
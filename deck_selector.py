@@ -7,14 +7,69 @@
 from typing import Optional, Tuple, List
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QListWidget, QListWidgetItem, QRadioButton, QButtonGroup,
+    QLabel, QListView, QRadioButton, QButtonGroup,
     QCheckBox, QGroupBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
 from anki.collection import Collection
 from .card_query import StudyMode
 
 
+# 预先生成各层级的缩进前缀，避免每个牌组都重新拼接空格串
+_INDENTS = tuple("    " * i for i in range(16))
+
+
+class DeckListModel(QAbstractListModel):
+    """牌组列表模型 - 显示文本只计算一次，打开对话框时不用逐项创建列表控件"""
+
+    def __init__(self, decks, parent=None):
+        """
+        初始化牌组列表模型
+
+        Args:
+            decks: all_names_and_ids() 返回的牌组列表
+            parent: 父对象
+        """
+        super().__init__(parent)
+        # 按名称排序一次
+        self._decks = sorted(decks, key=lambda x: x.name)
+        # 显示文本预先算好；rpartition 只做一次扫描、不像 split 分配整个列表
+        self._display_names = []
+        for deck in self._decks:
+            depth = deck.name.count("::")
+            indent = _INDENTS[depth] if depth < len(_INDENTS) else "    " * depth
+            leaf = deck.name.rpartition("::")[2]
+            self._display_names.append(f"{indent}📖 {leaf}")
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._decks)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        deck = self._decks[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            # 带缩进的显示名称（初始化时已算好）
+            return self._display_names[index.row()]
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # 显示完整路径作为提示
+            return deck.name
+
+        if role == Qt.ItemDataRole.UserRole:
+            return deck.id
+
+        return None
+
+    def deck_at(self, row: int):
+        """返回指定行对应的牌组对象"""
+        return self._decks[row]
+
+
 class DeckSelectionDialog(QDialog):
     """牌组选择对话框"""
 
@@ -47,9 +102,11 @@ class DeckSelectionDialog(QDialog):
         main_layout.addWidget(title_label)
 
         # 牌组列表（启用多选）
-        self.deck_list = QListWidget()
-        self.deck_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-        self.deck_list.itemDoubleClicked.connect(self._on_deck_double_clicked)
+        self.deck_list = QListView()
+        self.deck_list.setSelectionMode(QListView.SelectionMode.MultiSelection)
+        # 所有行高度一致，Qt 可以跳过逐项 sizeHint 计算
+        self.deck_list.setUniformItemSizes(True)
+        self.deck_list.doubleClicked.connect(self._on_deck_double_clicked)
         main_layout.addWidget(self.deck_list)
 
         # 加载牌组列表
@@ -120,29 +177,12 @@ class DeckSelectionDialog(QDialog):
 
     def _load_decks(self):
         """加载牌组列表"""
-        # 获取所有牌组
-        deck_manager = self.col.decks
-        all_decks = deck_manager.all_names_and_ids()
-
-        # 按名称排序
-        sorted_decks = sorted(all_decks, key=lambda x: x.name)
-
-        # 添加每个牌组
-        for deck in sorted_decks:
-            # 计算缩进层级
-            indent_level = deck.name.count("::")
-            indent = "    " * indent_level
-
-            # 创建列表项
-            deck_name = deck.name.split("::")[-1]  # 只显示最后一级名称
-            display_name = f"{indent}📖 {deck_name}"
-
-            item = QListWidgetItem(display_name)
-            item.setData(Qt.ItemDataRole.UserRole, deck.id)
-            item.setToolTip(deck.name)  # 显示完整路径作为提示
-            self.deck_list.addItem(item)
+        # 获取所有牌组，交给模型按需提供显示文本
+        all_decks = self.col.decks.all_names_and_ids()
+        self._deck_model = DeckListModel(all_decks, self)
+        self.deck_list.setModel(self._deck_model)
 
-    def _on_deck_double_clicked(self, item):
+    def _on_deck_double_clicked(self, index):
         """双击牌组时直接确认选择"""
         self.accept()
 
@@ -163,20 +203,19 @@ class DeckSelectionDialog(QDialog):
             (deck_ids, deck_names) 元组
             deck_ids 为空列表表示"全部牌组"
         """
-        selected_items = self.deck_list.selectedItems()
+        selected_indexes = self.deck_list.selectionModel().selectedIndexes()
 
-        if not selected_items:
+        if not selected_indexes:
             # 没有选择任何牌组，返回空列表表示全部牌组
             return [], "全部牌组"
 
         deck_ids = []
         deck_names = []
 
-        for item in selected_items:
-            deck_id = item.data(Qt.ItemDataRole.UserRole)
-            deck_name = item.text().strip().replace("📖 ", "")
-            deck_ids.append(deck_id)
-            deck_names.append(deck_name)
+        for index in selected_indexes:
+            deck = self._deck_model.deck_at(index.row())
+            deck_ids.append(deck.id)
+            deck_names.append(deck.name.rpartition("::")[2])  # 只显示最后一级名称
 
         # 生成显示名称
         if len(deck_names) == 1:
@@ -5,20 +5,39 @@
 """
 
 import random
+from os.path import basename
 from typing import List
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QSlider, QListWidget, QCheckBox, QSpinBox, QSystemTrayIcon, QMenu
 )
-from PyQt6.QtCore import Qt, QUrl, QTimer
+from PyQt6.QtCore import Qt, QUrl, QTimer, QSignalBlocker, pyqtSlot
 from PyQt6.QtGui import QIcon, QAction
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from aqt.utils import showInfo
 
 
+# 调试输出开关：print 在 GUI 线程上是同步 I/O，默认关闭
+_DEBUG = False
+
+# 状态名称表在导入时构建一次，不在每次信号回调里重建
+_MEDIA_STATUS_NAMES = {
+    QMediaPlayer.MediaStatus.NoMedia: "NoMedia",
+    QMediaPlayer.MediaStatus.LoadingMedia: "LoadingMedia",
+    QMediaPlayer.MediaStatus.LoadedMedia: "LoadedMedia",
+    QMediaPlayer.MediaStatus.StalledMedia: "StalledMedia",
+    QMediaPlayer.MediaStatus.BufferingMedia: "BufferingMedia",
+    QMediaPlayer.MediaStatus.BufferedMedia: "BufferedMedia",
+    QMediaPlayer.MediaStatus.EndOfMedia: "EndOfMedia",
+    QMediaPlayer.MediaStatus.InvalidMedia: "InvalidMedia"
+}
+
 class AudioPlayerWindow(QDialog):
     """音频播放器窗口 - 提供播放控制界面"""
 
+    # 托盘图标按类缓存，平台风格的标准图标查询只做一次
+    _TRAY_ICON_CACHE = None
+
     def __init__(self, audio_files: List[str], parent=None):
         """
         初始化播放器窗口
@@ -29,10 +48,27 @@ class AudioPlayerWindow(QDialog):
         """
         super().__init__(parent)
 
-        self.audio_files = audio_files.copy()  # 原始播放列表
-        self.shuffled_playlist = []  # 乱序后的播放列表
-        self.current_index = 0  # 当前播放索引
-        self.is_playing_next = False  # 防止重复触发播放下一曲
+        # 播放列表：路径字符串只在这一份列表里保存（乱序通过 _order 索引实现）
+        # list() 拷贝一次，防止调用方后续修改传入的列表
+        self.audio_files = list(audio_files)
+        # 乱序只打乱这个索引排列，不再复制整个路径列表
+        self._order = list(range(len(self.audio_files)))
+        # 曲目总数在窗口生命周期内不变，数字和字符串都只算一次
+        self._total = len(self.audio_files)
+        self._total_str = str(self._total)
+        self.current_index = 0  # 当前播放索引（指向 _order 中的位置）
+        # 文件名和文件 URL 只计算一次，与 audio_files 一一对应
+        self._display_names = [basename(path) for path in self.audio_files]
+        self._urls = [QUrl.fromLocalFile(path) for path in self.audio_files]
+        self._row_texts = []  # 当前乱序顺序下各行的基础文本（不含播放标记）
+        self._last_displayed_index = -1  # 上一次带播放标记的行
+        self._last_pos_bucket = -1  # 上次刷新进度条的 100ms 时间桶
+        self._last_shown_second = -1  # 上次时间标签显示的整秒数
+        self._duration_ms = 0  # 当前曲目时长（毫秒）
+        self._duration_str = "00:00"  # 当前曲目时长文本（换曲时才更新）
+        self._advance_token = 0  # 自动切歌令牌，换曲即递增，旧的定时回调自动作废
+        self._seeking = False  # 用户是否正在拖动进度条
+        self._pending_seek = 0  # 拖动过程中记录的目标位置（松开时才提交）
         self.auto_loop_enabled = True  # 自动循环开关（默认开启）
         self.loop_interval = 0  # 循环间隔（秒），默认0秒无间隔
 
@@ -41,11 +77,14 @@ class AudioPlayerWindow(QDialog):
         self.audio_output = QAudioOutput()
         self.player.setAudioOutput(self.audio_output)
 
+        # 备用播放器：提前加载下一曲，切歌时直接交换，省去打开文件的等待
+        self._next_player = QMediaPlayer()
+        self._next_audio_output = QAudioOutput()
+        self._next_player.setAudioOutput(self._next_audio_output)
+        self._preloaded_index = -1  # 已预加载曲目在 audio_files 中的索引
+
         # 连接播放器信号
-        self.player.mediaStatusChanged.connect(self._on_media_status_changed)
-        self.player.playbackStateChanged.connect(self._on_playback_state_changed)
-        self.player.positionChanged.connect(self._on_position_changed)
-        self.player.durationChanged.connect(self._on_duration_changed)
+        self._connect_player_signals(self.player)
 
         # 初始化界面
         self._init_ui()
@@ -55,9 +94,25 @@ class AudioPlayerWindow(QDialog):
 
         # 乱序播放列表并开始播放
         self._shuffle_playlist()
-        if self.shuffled_playlist:
+        if self._order:
             self._play_current()
 
+    def _connect_player_signals(self, player):
+        """连接播放器信号（主备播放器交换时复用）"""
+        # 媒体状态用队列连接：槽在下一次事件循环中执行，既不在信号处理
+        # 中直接操作播放器，也没有额外的定时器延迟
+        player.mediaStatusChanged.connect(
+            self._on_media_status_changed, Qt.ConnectionType.QueuedConnection
+        )
+        player.positionChanged.connect(self._on_position_changed)
+        player.durationChanged.connect(self._on_duration_changed)
+
+    def _disconnect_player_signals(self, player):
+        """断开播放器信号（交换后旧播放器不再驱动界面）"""
+        player.mediaStatusChanged.disconnect(self._on_media_status_changed)
+        player.positionChanged.disconnect(self._on_position_changed)
+        player.durationChanged.disconnect(self._on_duration_changed)
+
     def _init_ui(self):
         """初始化用户界面"""
         self.setWindowTitle("Audio Wash Player")
@@ -85,7 +140,9 @@ class AudioPlayerWindow(QDialog):
         # 进度条
         self.progress_slider = QSlider(Qt.Orientation.Horizontal)
         self.progress_slider.setEnabled(False)
+        self.progress_slider.sliderPressed.connect(self._on_slider_pressed)
         self.progress_slider.sliderMoved.connect(self._on_slider_moved)
+        self.progress_slider.sliderReleased.connect(self._on_slider_released)
         main_layout.addWidget(self.progress_slider)
 
         # 时间标签
@@ -145,11 +202,13 @@ class AudioPlayerWindow(QDialog):
         main_layout.addLayout(loop_settings_layout)
 
         # 播放列表标签
-        playlist_label = QLabel(f"播放列表 (共 {len(self.audio_files)} 首)")
+        playlist_label = QLabel(f"播放列表 (共 {self._total} 首)")
         main_layout.addWidget(playlist_label)
 
         # 播放列表显示
         self.playlist_widget = QListWidget()
+        # 所有行高度一致，Qt 可以跳过逐项 sizeHint 计算
+        self.playlist_widget.setUniformItemSizes(True)
         main_layout.addWidget(self.playlist_widget)
 
         # 关闭按钮改为最小化到托盘按钮
@@ -164,24 +223,61 @@ class AudioPlayerWindow(QDialog):
 
         self.setLayout(main_layout)
 
+    @classmethod
+    def _get_tray_icon(cls, style):
+        """获取托盘图标（按类缓存，重复打开播放器时不再查询平台风格）"""
+        if cls._TRAY_ICON_CACHE is None:
+            # 尝试使用 Anki 的图标，如果失败则使用默认图标
+            try:
+                from aqt import mw
+                if mw and mw.windowIcon():
+                    cls._TRAY_ICON_CACHE = mw.windowIcon()
+                else:
+                    # 使用默认应用图标
+                    cls._TRAY_ICON_CACHE = style.standardIcon(style.StandardPixmap.SP_MediaPlay)
+            except:
+                # 使用默认应用图标
+                cls._TRAY_ICON_CACHE = style.standardIcon(style.StandardPixmap.SP_MediaPlay)
+
+        return cls._TRAY_ICON_CACHE
+
     def _init_tray(self):
-        """初始化系统托盘"""
+        """初始化系统托盘（菜单在事件循环空闲时再构建，不占窗口打开时间）"""
         # 创建系统托盘图标
         self.tray_icon = QSystemTrayIcon(self)
+        self.tray_icon.setIcon(self._get_tray_icon(self.style()))
 
-        # 尝试使用 Anki 的图标，如果失败则使用默认图标
-        try:
-            from aqt import mw
-            if mw and mw.windowIcon():
-                self.tray_icon.setIcon(mw.windowIcon())
-            else:
-                # 使用默认应用图标
-                self.tray_icon.setIcon(self.style().standardIcon(self.style().StandardPixmap.SP_MediaPlay))
-        except:
-            # 使用默认应用图标
-            self.tray_icon.setIcon(self.style().standardIcon(self.style().StandardPixmap.SP_MediaPlay))
+        # 播放/暂停动作提前创建（播放状态回调会同步它的文本）
+        self.tray_play_pause_action = QAction("暂停", self)
+        self.tray_play_pause_action.triggered.connect(self._toggle_play_pause)
+
+        # 托盘菜单延迟构建，窗口打开更快
+        self._tray_menu = None
+
+        # 最小化提示的内容不变，参数元组只构建一次
+        self._tray_msg = (
+            "Audio Wash Player",
+            "播放器已最小化到托盘，双击图标可恢复窗口",
+            QSystemTrayIcon.MessageIcon.Information,
+            2000
+        )
+
+        # 双击托盘图标显示窗口
+        self.tray_icon.activated.connect(self._on_tray_activated)
+
+        # 显示托盘图标
+        self.tray_icon.show()
+
+        # 菜单在事件循环空闲时立即补建：某些平台（StatusNotifier 托盘）
+        # 的右键菜单由宿主直接展示，不会向应用发 activated 信号，
+        # 不能等到激活回调才构建
+        QTimer.singleShot(0, self._ensure_tray_menu)
+
+    def _ensure_tray_menu(self):
+        """按需构建托盘菜单（只构建一次）"""
+        if self._tray_menu is not None:
+            return
 
-        # 创建托盘菜单
         tray_menu = QMenu()
 
         # 显示窗口动作
@@ -190,8 +286,6 @@ class AudioPlayerWindow(QDialog):
         tray_menu.addAction(show_action)
 
         # 播放/暂停动作
-        self.tray_play_pause_action = QAction("暂停", self)
-        self.tray_play_pause_action.triggered.connect(self._toggle_play_pause)
         tray_menu.addAction(self.tray_play_pause_action)
 
         # 下一曲动作
@@ -207,129 +301,197 @@ class AudioPlayerWindow(QDialog):
         tray_menu.addAction(quit_action)
 
         self.tray_icon.setContextMenu(tray_menu)
+        self._tray_menu = tray_menu
 
-        # 双击托盘图标显示窗口
-        self.tray_icon.activated.connect(self._on_tray_activated)
-
-        # 显示托盘图标
-        self.tray_icon.show()
-
+    @pyqtSlot(QSystemTrayIcon.ActivationReason)
     def _on_tray_activated(self, reason):
         """托盘图标被激活时的回调"""
+        self._ensure_tray_menu()
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             self._show_window()
 
+    @pyqtSlot()
     def _minimize_to_tray(self):
         """最小化到系统托盘"""
+        self._ensure_tray_menu()
         self.hide()
-        self.tray_icon.showMessage(
-            "Audio Wash Player",
-            "播放器已最小化到托盘，双击图标可恢复窗口",
-            QSystemTrayIcon.MessageIcon.Information,
-            2000
-        )
+        self.tray_icon.showMessage(*self._tray_msg)
 
+    @pyqtSlot()
     def _show_window(self):
         """显示窗口"""
         self.show()
         self.activateWindow()  # 激活窗口，使其获得焦点
 
+    @pyqtSlot()
     def _quit_player(self):
         """退出播放器"""
         self.close()  # 关闭窗口
 
     def _shuffle_playlist(self):
-        """乱序播放列表"""
-        self.shuffled_playlist = self.audio_files.copy()
-        random.shuffle(self.shuffled_playlist)
+        """乱序播放列表（原地打乱索引排列，零路径字符串分配）"""
+        random.shuffle(self._order)
         self.current_index = 0
-        self._update_playlist_display()
+        self._populate_playlist_display()
 
+    @pyqtSlot()
     def _reshuffle(self):
-        """重新乱序并从头开始播放"""
-        self._shuffle_playlist()
-        if self.shuffled_playlist:
-            self._play_current()
-
+        """重新乱序并从头开始播放（重建和标记更新合并为一次重绘）"""
+        self.playlist_widget.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.playlist_widget)
+        try:
+            self._shuffle_playlist()
+            if self._order:
+                self._play_current()
+        finally:
+            blocker.unblock()
+            self.playlist_widget.setUpdatesEnabled(True)
+            self.playlist_widget.viewport().update()
+
+    @pyqtSlot(int)
     def _on_auto_loop_toggled(self, state):
         """自动循环开关切换"""
         self.auto_loop_enabled = (state == Qt.CheckState.Checked.value)
-        print(f"[DEBUG] Auto loop {'enabled' if self.auto_loop_enabled else 'disabled'}")
+        if _DEBUG:
+            print(f"[DEBUG] Auto loop {'enabled' if self.auto_loop_enabled else 'disabled'}")
 
+    @pyqtSlot(int)
     def _on_interval_changed(self, value):
         """循环间隔改变"""
         self.loop_interval = value
-        print(f"[DEBUG] Loop interval changed to {value} seconds")
+        if _DEBUG:
+            print(f"[DEBUG] Loop interval changed to {value} seconds")
+
+    def _populate_playlist_display(self):
+        """重建整个播放列表显示（只在乱序后调用一次）"""
+        # 各行的基础文本按当前乱序顺序缓存，之后只做增量更新
+        self._row_texts = [
+            f"{i+1}. {self._display_names[idx]}"
+            for i, idx in enumerate(self._order)
+        ]
+
+        # 批量插入：屏蔽刷新和选中信号，Qt 只做一次整体布局
+        # setUpdatesEnabled 不计数，恢复为进入时的状态才不会解除外层冻结
+        items = [f"  {text}" for text in self._row_texts]
+        prev_updates = self.playlist_widget.updatesEnabled()
+        self.playlist_widget.setUpdatesEnabled(False)
+        self.playlist_widget.blockSignals(True)
+        self.playlist_widget.clear()
+        self.playlist_widget.addItems(items)
+        self.playlist_widget.blockSignals(False)
+        self.playlist_widget.setUpdatesEnabled(prev_updates)
+
+        self._last_displayed_index = -1
+        self._update_playlist_display()
 
     def _update_playlist_display(self):
-        """更新播放列表显示"""
-        self.playlist_widget.clear()
-        for i, file_path in enumerate(self.shuffled_playlist):
-            # 只显示文件名
-            import os
-            filename = os.path.basename(file_path)
-            prefix = "▶ " if i == self.current_index else "  "
-            self.playlist_widget.addItem(f"{prefix}{i+1}. {filename}")
+        """更新播放列表显示（只改上一条和当前条两行，不重建整表）"""
+        # 同样恢复为进入时的刷新状态，嵌套在外层冻结里时不会提前解冻
+        prev_updates = self.playlist_widget.updatesEnabled()
+        self.playlist_widget.setUpdatesEnabled(False)
+
+        # 去掉上一条的播放标记
+        last = self._last_displayed_index
+        if 0 <= last < self.playlist_widget.count():
+            self.playlist_widget.item(last).setText(f"  {self._row_texts[last]}")
+
+        # 给当前条加上播放标记
+        current = self.current_index
+        if 0 <= current < self.playlist_widget.count():
+            self.playlist_widget.item(current).setText(f"▶ {self._row_texts[current]}")
+
+        self._last_displayed_index = current
+        self.playlist_widget.setUpdatesEnabled(prev_updates)
 
         # 滚动到当前播放项
-        self.playlist_widget.setCurrentRow(self.current_index)
+        self.playlist_widget.setCurrentRow(current)
 
     def _play_current(self):
         """播放当前索引的音频"""
-        if not self.shuffled_playlist:
+        if not self._order:
             self.status_label.setText("播放列表为空")
             return
 
-        # 获取当前文件路径
-        current_file = self.shuffled_playlist[self.current_index]
+        # 换曲即递增令牌，间隔等待中的旧定时回调不会再触发切歌
+        self._advance_token += 1
+
+        # 当前曲目在 audio_files 中的索引，URL 和文件名都已预先算好
+        idx = self._order[self.current_index]
+
+        if idx == self._preloaded_index:
+            # 该曲目已在备用播放器中加载好：交换主备播放器，跳过 setSource
+            self._disconnect_player_signals(self.player)
+            self.player.stop()
+            self.player, self._next_player = self._next_player, self.player
+            self.audio_output, self._next_audio_output = (
+                self._next_audio_output, self.audio_output
+            )
+            self._connect_player_signals(self.player)
+            # 预加载时 durationChanged 已在信号断开状态下发出过，
+            # 换曲后主动补读一次，进度条和总时长才会切到新曲目
+            self._on_duration_changed(self.player.duration())
+            self.player.play()
+        else:
+            # 预加载未命中（手动切歌、重新乱序等），正常设置媒体源
+            self.player.setSource(self._urls[idx])
+            self.player.play()
 
-        # 设置媒体源并播放
-        self.player.setSource(QUrl.fromLocalFile(current_file))
-        self.player.play()
+        self._preloaded_index = -1
+        # 等当前曲目起播后再预加载下一曲，避免争抢磁盘 I/O
+        QTimer.singleShot(500, self._preload_next)
 
         # 更新界面
-        import os
-        filename = os.path.basename(current_file)
+        filename = self._display_names[idx]
         self.current_file_label.setText(f"正在播放: {filename}")
-        self.status_label.setText(f"播放中 ({self.current_index + 1}/{len(self.shuffled_playlist)})")
+        self.status_label.setText(f"播放中 ({self.current_index + 1}/{self._total_str})")
         self.play_pause_button.setText("⏸ 暂停")
         self.tray_play_pause_action.setText("暂停")  # 同步更新托盘菜单
 
         # 更新播放列表显示
         self._update_playlist_display()
 
+    @pyqtSlot()
+    def _preload_next(self):
+        """把下一曲加载进备用播放器，切歌时即可直接交换"""
+        if not self._order:
+            return
+
+        next_idx = self._order[(self.current_index + 1) % len(self._order)]
+        self._next_player.setSource(self._urls[next_idx])
+        self._preloaded_index = next_idx
+
+    @pyqtSlot()
     def _play_next(self):
         """播放下一曲"""
-        print(f"[DEBUG] _play_next called, current_index={self.current_index}, playlist_length={len(self.shuffled_playlist)}")
+        if _DEBUG:
+            print(f"[DEBUG] _play_next called, current_index={self.current_index}, playlist_length={len(self._order)}")
 
-        if not self.shuffled_playlist:
-            print("[DEBUG] Playlist is empty!")
+        if not self._order:
             return
 
         self.current_index += 1
-        print(f"[DEBUG] Incremented index to {self.current_index}")
 
         # 如果到达列表末尾，重新乱序并从头开始（无限循环）
-        if self.current_index >= len(self.shuffled_playlist):
-            print("[DEBUG] Reached end of playlist, reshuffling...")
+        if self.current_index >= len(self._order):
             self._shuffle_playlist()
 
-        print(f"[DEBUG] About to play current (index={self.current_index})")
         self._play_current()
 
+    @pyqtSlot()
     def _play_previous(self):
         """播放上一曲"""
-        if not self.shuffled_playlist:
+        if not self._order:
             return
 
         self.current_index -= 1
 
         # 如果到达列表开头，跳到末尾
         if self.current_index < 0:
-            self.current_index = len(self.shuffled_playlist) - 1
+            self.current_index = len(self._order) - 1
 
         self._play_current()
 
+    @pyqtSlot()
     def _toggle_play_pause(self):
         """切换播放/暂停状态"""
         if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
@@ -341,114 +503,118 @@ class AudioPlayerWindow(QDialog):
             self.player.play()
             self.play_pause_button.setText("⏸ 暂停")
             self.tray_play_pause_action.setText("暂停")  # 同步更新托盘菜单
-            self.status_label.setText(f"播放中 ({self.current_index + 1}/{len(self.shuffled_playlist)})")
+            self.status_label.setText(f"播放中 ({self.current_index + 1}/{self._total_str})")
 
+    @pyqtSlot(QMediaPlayer.MediaStatus)
     def _on_media_status_changed(self, status):
         """媒体状态改变时的回调"""
         # 调试信息
-        status_names = {
-            QMediaPlayer.MediaStatus.NoMedia: "NoMedia",
-            QMediaPlayer.MediaStatus.LoadingMedia: "LoadingMedia",
-            QMediaPlayer.MediaStatus.LoadedMedia: "LoadedMedia",
-            QMediaPlayer.MediaStatus.StalledMedia: "StalledMedia",
-            QMediaPlayer.MediaStatus.BufferingMedia: "BufferingMedia",
-            QMediaPlayer.MediaStatus.BufferedMedia: "BufferedMedia",
-            QMediaPlayer.MediaStatus.EndOfMedia: "EndOfMedia",
-            QMediaPlayer.MediaStatus.InvalidMedia: "InvalidMedia"
-        }
-        print(f"[DEBUG] Media status changed: {status_names.get(status, 'Unknown')}")
+        if _DEBUG:
+            print(f"[DEBUG] Media status changed: {_MEDIA_STATUS_NAMES.get(status, 'Unknown')}")
 
         if status == QMediaPlayer.MediaStatus.EndOfMedia:
-            # 防止重复触发
-            if self.is_playing_next:
-                print("[DEBUG] Already playing next, skipping...")
-                return
-
-            print("[DEBUG] End of media detected, playing next...")
-            self.is_playing_next = True
-            # 使用 QTimer 延迟执行，避免在信号处理中直接操作播放器
-            QTimer.singleShot(100, self._delayed_play_next)
-
-    def _on_playback_state_changed(self, state):
-        """播放状态改变时的回调 - 用于更可靠地检测播放结束"""
-        state_names = {
-            QMediaPlayer.PlaybackState.StoppedState: "Stopped",
-            QMediaPlayer.PlaybackState.PlayingState: "Playing",
-            QMediaPlayer.PlaybackState.PausedState: "Paused"
-        }
-        print(f"[DEBUG] Playback state changed: {state_names.get(state, 'Unknown')}")
-
-        # 只在真正停止时才处理（不是暂停）
-        if state == QMediaPlayer.PlaybackState.StoppedState:
-            # 检查是否是因为播放完毕而停止
-            if self.player.mediaStatus() == QMediaPlayer.MediaStatus.EndOfMedia:
-                # 防止重复触发
-                if self.is_playing_next:
-                    print("[DEBUG] Already playing next (from state change), skipping...")
-                    return
-
-                print("[DEBUG] Stopped at end of media, playing next...")
-                self.is_playing_next = True
-                # 使用 QTimer 延迟执行
-                QTimer.singleShot(100, self._delayed_play_next)
+            # 播放结束只由这一个回调负责调度下一曲（Qt6 标准做法）
+            # 队列连接已保证此时不在信号发射栈里，直接切歌即可，曲目间零延迟
+            self._delayed_play_next()
 
+    @pyqtSlot()
     def _delayed_play_next(self):
         """延迟播放下一曲 - 避免在信号处理中直接操作"""
-        print("[DEBUG] _delayed_play_next called")
-        self.is_playing_next = False
-
         # 检查是否启用自动循环
         if not self.auto_loop_enabled:
-            print("[DEBUG] Auto loop is disabled, stopping playback")
             self.status_label.setText("播放完毕（自动循环已关闭）")
             return
 
         # 如果设置了循环间隔，先等待
         if self.loop_interval > 0:
-            print(f"[DEBUG] Waiting {self.loop_interval} seconds before next track...")
             self.status_label.setText(f"等待 {self.loop_interval} 秒后播放下一曲...")
             # 使用 QTimer 延迟指定的秒数后再播放下一曲
-            QTimer.singleShot(self.loop_interval * 1000, self._play_next)
+            # 捕获当前令牌：等待期间用户手动切歌会使旧回调作废
+            token = self._advance_token
+            QTimer.singleShot(self.loop_interval * 1000,
+                              lambda t=token: self._advance_if_current(t))
         else:
             # 无间隔，直接播放下一曲
             self._play_next()
 
+    def _advance_if_current(self, token: int):
+        """间隔等待结束后的回调 - 令牌已过期说明期间发生过切歌，不再推进"""
+        if token != self._advance_token:
+            return
+        self._play_next()
+
+    @pyqtSlot(int)
     def _on_position_changed(self, position):
-        """播放位置改变时的回调"""
+        """播放位置改变时的回调（节流到最多 10Hz，减轻事件循环负担）"""
+        # 用户拖动期间不回写滑块，避免反馈循环导致的跳动
+        if self._seeking:
+            return
+
+        # positionChanged 触发频率由后端决定，进度条按 100ms 桶合并刷新
+        bucket = position // 100
+        if bucket == self._last_pos_bucket:
+            return
+        self._last_pos_bucket = bucket
+
         self.progress_slider.setValue(position)
-        self._update_time_label()
 
+        # 时间标签精度只有秒，整秒变化时才重新格式化
+        second = position // 1000
+        if second != self._last_shown_second:
+            self._last_shown_second = second
+            self._update_time_label(position)
+
+    @pyqtSlot(int)
     def _on_duration_changed(self, duration):
         """音频时长改变时的回调"""
         self.progress_slider.setMaximum(duration)
         self.progress_slider.setEnabled(duration > 0)
-        self._update_time_label()
-
+        # 时长只在这里记录并重新格式化，positionChanged 回调直接复用
+        self._duration_ms = duration
+        self._duration_str = self._format_time(duration)
+        self._update_time_label(0)
+
+    @pyqtSlot()
+    def _on_slider_pressed(self):
+        """开始拖动进度条：暂停位置回写，避免滑块和播放位置互相拉扯"""
+        self._seeking = True
+        self._pending_seek = self.progress_slider.value()
+
+    @pyqtSlot(int)
     def _on_slider_moved(self, position):
-        """进度条拖动时的回调"""
-        self.player.setPosition(position)
+        """进度条拖动时的回调（只记录目标位置，不逐像素寻址）"""
+        self._pending_seek = position
 
-    def _update_time_label(self):
-        """更新时间显示"""
-        position = self.player.position()
-        duration = self.player.duration()
+    @pyqtSlot()
+    def _on_slider_released(self):
+        """松开进度条：一次性提交寻址"""
+        self.player.setPosition(self._pending_seek)
+        self._seeking = False
 
-        position_str = self._format_time(position)
-        duration_str = self._format_time(duration)
+    def _update_time_label(self, position):
+        """
+        更新时间显示（只格式化播放位置，时长文本用缓存）
 
-        self.time_label.setText(f"{position_str} / {duration_str}")
+        位置由信号参数传入，不再反向调用 player.position()/duration()
+        """
+        # 时长未知时（媒体还没加载好）不刷新
+        if self._duration_ms <= 0:
+            return
+
+        position_str = self._format_time(position)
+        self.time_label.setText(f"{position_str} / {self._duration_str}")
 
-    def _format_time(self, ms):
+    @staticmethod
+    def _format_time(ms):
         """格式化时间（毫秒转为 MM:SS）"""
-        seconds = ms // 1000
-        minutes = seconds // 60
-        seconds = seconds % 60
+        minutes, seconds = divmod(ms // 1000, 60)
         return f"{minutes:02d}:{seconds:02d}"
 
     def closeEvent(self, event):
         """窗口关闭时的处理"""
-        # 停止播放
+        # 停止播放（备用播放器也一并停掉）
         self.player.stop()
+        self._next_player.stop()
         # 隐藏托盘图标
         if hasattr(self, 'tray_icon'):
             self.tray_icon.hide()